@@ -5,11 +5,17 @@
 
 import os
 import time
+import asyncio
 import logging
+import queue
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import re
+import sqlite3
+import hashlib
 from dataclasses import dataclass
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from concurrent.futures import ThreadPoolExecutor
 
 # Web scraping
 from selenium import webdriver
@@ -17,14 +23,14 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+import lxml.html
+from lxml import etree
+import aiohttp
 
 # Data processing
 import pandas as pd
-import requests
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut
+import ahocorasick
 
 # Database
 from supabase import create_client, Client
@@ -40,7 +46,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+CEQA_BASE_URL = "https://ceqanet.lci.ca.gov"
+
+# Page number query parameter in search result pagination links
+PAGE_PARAM_RE = re.compile(r'[?&]page=(\d+)', re.I)
+
+# Date formats found on project pages: 01/31/2024, 2024-01-31, January 31, 2024
+DATE_US_RE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+DATE_ISO_RE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+DATE_LONG_RE = re.compile(r'^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$')
+MONTH_NUMBERS = {
+    name: number for number, name in enumerate(
+        ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+         'august', 'september', 'october', 'november', 'december'], 1
+    )
+}
+
+# HTTP settings for search result and project detail page fetching
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+MAX_CONCURRENT_REQUESTS = 20
+REQUEST_TIMEOUT = 30  # seconds
+
+# Browsers used for project pages whose static HTML has no project fields
+BROWSER_POOL_SIZE = 4
+
+# A rendered project page has its title label in the DOM
+RENDERED_PROJECT_XPATH = (
+    "//*[self::dt or self::th or self::label][normalize-space()='Project Title']"
+)
+
+# Geocoding (Nominatim usage policy: max 1 request/second, identify the client)
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+GEOCODER_USER_AGENT = "byc_warehouse_scraper"
+GEOCODE_INTERVAL = 1.0  # seconds between Nominatim requests
+
+# Local caches for geocoding results and project page HTML
+CACHE_DB_PATH = os.getenv('SCRAPER_CACHE_DB', '.scraper_cache.db')
+PAGE_CACHE_DIR = os.getenv('SCRAPER_PAGE_CACHE_DIR', '.page_cache')
+GEOCODE_MISS_TTL = 7 * 24 * 60 * 60  # retry failed lookups after a week
+
+# Rows per Supabase upsert request (keeps payloads under PostgREST limits)
+UPSERT_BATCH_SIZE = 500
+
+# CEQA document types mapped to UI-friendly statuses (anything else is a Proposal)
+UI_STATUS_MAP = {
+    'NOP': 'Proposal',
+    'IS/MND': 'Under Review',
+    'DEIR': 'Under Review',
+    'NOD': 'Approved',
+    'FEIR': 'Approved'
+}
+
+@dataclass(slots=True)
 class CEQAProject:
     """Data structure for a scraped CEQA project"""
     title: str
@@ -79,8 +139,32 @@ class CEQAScraper:
         self.driver = None
         self.wait = None
         
-        # Geocoding
-        self.geocoder = Nominatim(user_agent="byc_warehouse_scraper")
+        # Geocoding rate limiter: earliest event-loop time for the next request
+        self._next_geocode_at = 0.0
+        
+        # Compiled XPath lookups for "label -> value" pairs on project pages:
+        # an exact label match first, then any leaf element containing the label
+        self.field_xpath = etree.XPath(
+            ".//*[self::dt or self::th or self::label][normalize-space()=$name]"
+            "/following-sibling::*[1]"
+        )
+        self.field_fallback_xpath = etree.XPath(
+            ".//*[not(*)][contains(normalize-space(), $name)]/following-sibling::*[1]"
+        )
+        
+        # Persistent geocoding cache, keyed by normalized address, and
+        # project page validators (ETag / Last-Modified) for conditional GETs
+        self.cache_db = sqlite3.connect(CACHE_DB_PATH)
+        self.cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS geocode_cache ("
+            "key TEXT PRIMARY KEY, latitude REAL, longitude REAL, cached_at REAL NOT NULL)"
+        )
+        self.cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS page_cache ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, html_path TEXT NOT NULL)"
+        )
+        self.cache_db.commit()
+        os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
         
         # Warehouse detection keywords
         self.warehouse_keywords = {
@@ -88,6 +172,18 @@ class CEQAScraper:
             'medium_confidence': ['industrial', 'cargo', 'freight', 'supply chain', 'e-commerce'],
             'low_confidence': ['storage', 'shipping', 'receiving', 'inventory']
         }
+        self.keyword_weights = {
+            'high_confidence': 0.3,
+            'medium_confidence': 0.15,
+            'low_confidence': 0.05
+        }
+        
+        # Fixed keyword order, with a parallel list of weights
+        self.keyword_list = []
+        self.keyword_weight_list = []
+        for level, keywords in self.warehouse_keywords.items():
+            self.keyword_list.extend(keywords)
+            self.keyword_weight_list.extend([self.keyword_weights[level]] * len(keywords))
         
         # IE Cities for validation
         self.ie_cities = {
@@ -96,9 +192,25 @@ class CEQAScraper:
             'riverside': ['riverside', 'moreno valley', 'perris', 'corona', 'norco', 
                          'eastvale', 'jurupa valley', 'lake elsinore', 'menifee']
         }
+        
+        # Single multi-pattern matcher over warehouse keywords and IE city
+        # names, tagged so one scan serves both classification and location
+        self.text_automaton = ahocorasick.Automaton()
+        for index, keyword in enumerate(self.keyword_list):
+            self.text_automaton.add_word(keyword, ('keyword', index))
+        for county_name, cities in self.ie_cities.items():
+            for city_name in cities:
+                self.text_automaton.add_word(city_name, ('city', (city_name, county_name)))
+        self.text_automaton.make_automaton()
 
     def setup_driver(self, headless: bool = True):
         """Initialize Selenium WebDriver with proper configuration"""
+        self.driver = self._new_driver(headless)
+        self.wait = WebDriverWait(self.driver, 10)
+        logger.info("WebDriver initialized")
+
+    def _new_driver(self, headless: bool = True) -> webdriver.Chrome:
+        """Create a Chrome WebDriver with the scraper's configuration"""
         chrome_options = Options()
         if headless:
             chrome_options.add_argument("--headless")
@@ -107,20 +219,24 @@ class CEQAScraper:
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
         
+        # Only the HTML is consumed, so skip images and notifications and
+        # return from driver.get() once the DOM is parsed
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        chrome_options.page_load_strategy = "eager"
+        
         # User agent to avoid detection
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        )
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
         
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.wait = WebDriverWait(self.driver, 10)
-        logger.info("WebDriver initialized")
+        return webdriver.Chrome(options=chrome_options)
 
     def navigate_to_ceqa_search(self):
         """Navigate to CEQA advanced search page"""
         try:
-            self.driver.get("https://ceqanet.lci.ca.gov/Search/Advanced")
+            self.driver.get(f"{CEQA_BASE_URL}/Search/Advanced")
             logger.info("Navigated to CEQA advanced search")
             
             # Wait for page to load
@@ -186,74 +302,359 @@ class CEQAScraper:
             raise
 
     def extract_project_links(self) -> List[str]:
-        """Extract all project detail page URLs from search results"""
+        """Extract all project detail page URLs from search results
+        
+        The first results page is read from the browser; the remaining pages
+        are fetched concurrently over HTTP using the submitted search URL.
+        Pagers often link only a window of pages, so fetching continues in
+        rounds while fetched pages link past the highest page seen so far.
+        Pagers without page= links are followed by clicking "Next" instead.
+        """
+        search_url = self.driver.current_url
+        first_page = self.driver.page_source
+        cookies = {cookie['name']: cookie['value'] for cookie in self.driver.get_cookies()}
+        
+        project_links, last_page = self._parse_results_page(first_page)
+        logger.info(f"Page 1: Found {len(project_links)} projects")
+        
+        if last_page > 1:
+            project_links.extend(asyncio.run(self._fetch_result_pages(search_url, last_page, cookies)))
+        else:
+            project_links.extend(self._click_through_pages())
+        
+        # A results row can link the same project more than once
+        project_links = list(dict.fromkeys(project_links))
+        
+        logger.info(f"Total projects found: {len(project_links)}")
+        return project_links
+
+    def _parse_results_page(self, html: str) -> Tuple[List[str], int]:
+        """Extract project detail URLs and the highest linked page number
+        
+        Only anchor hrefs are needed, so the page is parsed once and its
+        links are walked in a single pass.
+        """
+        try:
+            tree = lxml.html.fromstring(html)
+        except Exception as e:
+            logger.error(f"Error parsing results page: {e}")
+            return [], 1
+        
+        project_links = []
+        last_page = 1
+        for href in tree.xpath('.//a/@href'):
+            # Project title links (adjust selector based on actual HTML)
+            if '/Project/' in href:
+                project_links.append(urljoin(CEQA_BASE_URL, href))
+                continue
+            
+            # Pagination links
+            match = PAGE_PARAM_RE.search(href)
+            if match:
+                last_page = max(last_page, int(match.group(1)))
+        
+        return project_links, last_page
+
+    def _click_through_pages(self) -> List[str]:
+        """Collect project links from pages 2+ by clicking "Next" in the browser
+        
+        Fallback for pagers whose links carry no page= parameter (e.g. "#"
+        or JavaScript handlers), so the pages can't be fetched directly.
+        """
         project_links = []
         page_num = 1
         
         while True:
             try:
-                # Get current page's project links
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                
-                # Find project title links (adjust selector based on actual HTML)
-                title_links = soup.find_all('a', href=re.compile(r'/Project/'))
-                page_links = [f"https://ceqanet.lci.ca.gov{link['href']}" 
-                             for link in title_links]
+                next_button = self.driver.find_element(By.LINK_TEXT, "Next")
+                if "disabled" in (next_button.get_attribute("class") or ""):
+                    break
+                next_button.click()
+                time.sleep(3)
+                page_num += 1
                 
+                page_links = self._parse_results_page(self.driver.page_source)[0]
                 project_links.extend(page_links)
                 logger.info(f"Page {page_num}: Found {len(page_links)} projects")
                 
-                # Try to navigate to next page
-                try:
-                    next_button = self.driver.find_element(By.LINK_TEXT, "Next")
-                    if "disabled" in next_button.get_attribute("class"):
-                        break
-                    next_button.click()
-                    time.sleep(3)
-                    page_num += 1
-                except NoSuchElementException:
+                if not page_links:
                     break
                     
+            except NoSuchElementException:
+                break
             except Exception as e:
                 logger.error(f"Error extracting project links on page {page_num}: {e}")
                 break
         
-        logger.info(f"Total projects found: {len(project_links)}")
         return project_links
 
-    def scrape_project_details(self, project_url: str) -> Optional[CEQAProject]:
-        """Scrape detailed information from a single project page"""
+    def _page_url(self, search_url: str, page_num: int) -> str:
+        """Return the search URL pointing at the given results page"""
+        parts = urlsplit(search_url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                 if k.lower() != 'page']
+        query.append(('page', str(page_num)))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    async def _fetch_result_pages(self, search_url: str, last_page: int,
+                                  cookies: Dict[str, str]) -> List[str]:
+        """Fetch results pages from 2 onward and return their project links
+        
+        Each round fetches every page up to the highest page number seen so
+        far, concurrently. Rounds stop once no fetched page links further,
+        or once a page comes back with no projects.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def fetch_page(session: aiohttp.ClientSession, page_num: int) -> str:
+            async with semaphore:
+                try:
+                    return await self._fetch_html(session, self._page_url(search_url, page_num))
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error(f"Error fetching results page {page_num}: {e}")
+                    return ""
+        
+        project_links = []
+        fetched_through = 1
+        async with self._http_session(cookies) as session:
+            while last_page > fetched_through:
+                page_nums = range(fetched_through + 1, last_page + 1)
+                pages = await asyncio.gather(*[fetch_page(session, page_num) for page_num in page_nums])
+                fetched_through = last_page
+                
+                reached_end = False
+                for page_num, html in zip(page_nums, pages):
+                    if not html:
+                        continue
+                    
+                    page_links, linked_page = self._parse_results_page(html)
+                    project_links.extend(page_links)
+                    logger.info(f"Page {page_num}: Found {len(page_links)} projects")
+                    
+                    if not page_links:
+                        reached_end = True
+                    last_page = max(last_page, linked_page)
+                
+                if reached_end:
+                    if last_page > fetched_through:
+                        logger.warning(f"Stopping at page {fetched_through} (empty page) "
+                                       f"although page {last_page} is linked")
+                    break
+        
+        return project_links
+
+    def _http_session(self, cookies: Optional[Dict[str, str]] = None) -> aiohttp.ClientSession:
+        """Create an HTTP session with the scraper's connection limits"""
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, cookies=cookies)
+
+    def _geocoder_session(self) -> aiohttp.ClientSession:
+        """Create the keep-alive session used for all Nominatim requests
+        
+        Geocoding is strictly sequential, so a single pooled connection is
+        reused for the whole job instead of competing with page fetches.
+        """
+        connector = aiohttp.TCPConnector(limit=1)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        headers = {'User-Agent': GEOCODER_USER_AGENT}
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers)
+
+    async def _fetch_html(self, session: aiohttp.ClientSession, url: str) -> str:
+        """Fetch the raw HTML of a page"""
+        async with session.get(url, headers={'User-Agent': USER_AGENT}) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    async def _fetch_project_html(self, session: aiohttp.ClientSession, url: str) -> str:
+        """Fetch a project page, revalidating any cached copy with a conditional GET
+        
+        CEQA records rarely change once posted, so most re-runs get a
+        bodiless 304 and the HTML is read back from disk.
+        """
+        headers = {'User-Agent': USER_AGENT}
+        cached = self._get_cached_page(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                with open(cached[2], encoding='utf-8') as f:
+                    return f.read()
+            
+            response.raise_for_status()
+            html = await response.text()
+            self._cache_page(url, response.headers.get('ETag'),
+                             response.headers.get('Last-Modified'), html)
+            return html
+
+    def _get_cached_page(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], str]]:
+        """Look up cached validators and HTML path for a page still present on disk"""
+        row = self.cache_db.execute(
+            "SELECT etag, last_modified, html_path FROM page_cache WHERE url = ?", (url,)
+        ).fetchone()
+        if not row or not os.path.exists(row[2]):
+            return None
+        return row
+
+    def _cache_page(self, url: str, etag: Optional[str], last_modified: Optional[str], html: str):
+        """Store page HTML on disk and its validators in the cache (if it has any)"""
+        if not etag and not last_modified:
+            return
+        
+        html_path = os.path.join(PAGE_CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + '.html')
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        
+        self.cache_db.execute(
+            "INSERT OR REPLACE INTO page_cache (url, etag, last_modified, html_path) "
+            "VALUES (?, ?, ?, ?)",
+            (url, etag, last_modified, html_path)
+        )
+        self.cache_db.commit()
+
+    async def _scrape_project(self, session: aiohttp.ClientSession,
+                              semaphore: asyncio.Semaphore,
+                              geocode_queue: asyncio.Queue,
+                              browser_urls: List[str],
+                              project_url: str) -> Optional[CEQAProject]:
+        """Fetch and parse a single project page, then queue it for geocoding
+        
+        Pages that fetch fine but don't parse are left in browser_urls to be
+        retried with a real browser.
+        """
+        async with semaphore:
+            try:
+                html = await self._fetch_project_html(session, project_url)
+            except Exception as e:
+                # Any failure drops only this project, never the whole gather
+                logger.error(f"Error fetching project {project_url}: {e}")
+                return None
+        
+        project = self.scrape_project_details(project_url, html)
+        if project:
+            geocode_queue.put_nowait(project)
+        else:
+            browser_urls.append(project_url)
+        return project
+
+    async def scrape_projects(self, project_urls: List[str]) -> List[CEQAProject]:
+        """Fetch, parse and geocode all project detail pages concurrently
+        
+        Geocoding runs in a single background worker fed by a queue, so its
+        rate limit overlaps with page fetching instead of adding to it.
+        """
+        logger.info(f"Scraping {len(project_urls)} project pages")
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async with self._http_session() as session, self._geocoder_session() as geocoder_session:
+            geocode_queue = asyncio.Queue()
+            geocoder = asyncio.create_task(self._geocode_worker(geocoder_session, geocode_queue))
+            
+            browser_urls = []
+            results = await asyncio.gather(
+                *[self._scrape_project(session, semaphore, geocode_queue, browser_urls, url)
+                  for url in project_urls]
+            )
+            
+            # Retry pages that need JavaScript while the geocoder keeps running
+            if browser_urls:
+                browser_projects = await asyncio.to_thread(self._scrape_with_browsers, browser_urls)
+                for project in browser_projects:
+                    geocode_queue.put_nowait(project)
+                results.extend(browser_projects)
+            
+            # Signal the geocoder that no more projects are coming
+            await geocode_queue.put(None)
+            await geocoder
+        
+        return [project for project in results if project]
+
+    def _scrape_with_browsers(self, project_urls: List[str]) -> List[CEQAProject]:
+        """Scrape project pages through a pool of WebDrivers, one per worker thread"""
+        pool_size = min(BROWSER_POOL_SIZE, len(project_urls))
+        logger.info(f"Scraping {len(project_urls)} project pages with {pool_size} browsers")
+        
+        drivers = queue.Queue()
+        
+        def scrape(project_url: str) -> Optional[CEQAProject]:
+            driver = drivers.get()
+            try:
+                driver.get(project_url)
+                
+                # Pages load eagerly, so wait for client-side rendering of the fields
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.XPATH, RENDERED_PROJECT_XPATH))
+                )
+                project = self.scrape_project_details(project_url, driver.page_source)
+                if not project:
+                    logger.warning(f"No project details found at {project_url}")
+                return project
+            except TimeoutException:
+                logger.warning(f"Project details never rendered at {project_url}")
+                return None
+            except WebDriverException as e:
+                logger.error(f"Error loading project {project_url} in browser: {e}")
+                return None
+            finally:
+                drivers.put(driver)
+        
+        # This is only a fallback: if the pool can't run, keep the HTTP results
         try:
-            self.driver.get(project_url)
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            for _ in range(pool_size):
+                drivers.put(self._new_driver())
             
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                results = list(executor.map(scrape, project_urls))
+        except Exception as e:
+            logger.error(f"Browser fallback failed, skipping {len(project_urls)} project pages: {e}")
+            return []
+        finally:
+            while not drivers.empty():
+                try:
+                    drivers.get().quit()
+                except WebDriverException as e:
+                    logger.debug(f"Error closing browser: {e}")
+        
+        return [project for project in results if project]
+
+    def scrape_project_details(self, project_url: str, html: str) -> Optional[CEQAProject]:
+        """Parse detailed information from a single project page's HTML"""
+        try:
+            tree = lxml.html.fromstring(html)
             
             # Extract basic information (adjust selectors based on actual HTML)
-            title = self._extract_field(soup, "Project Title", "h1")
-            lead_agency = self._extract_field(soup, "Lead Agency")
-            location = self._extract_field(soup, "Location")
-            description = self._extract_field(soup, "Project Description", "div")
-            project_type = self._extract_field(soup, "Project Type")
-            document_type = self._extract_field(soup, "Document Type")
-            ceqa_status = self._extract_field(soup, "CEQA Status")
-            
-            # Parse location into city/county
-            city, county = self._parse_location(location)
+            title = self._extract_field(tree, "Project Title")
+            lead_agency = self._extract_field(tree, "Lead Agency")
+            location = self._extract_field(tree, "Location")
+            description = self._extract_field(tree, "Project Description")
+            project_type = self._extract_field(tree, "Project Type")
+            document_type = self._extract_field(tree, "Document Type")
+            ceqa_status = self._extract_field(tree, "CEQA Status")
+            
+            # No fields at all usually means the page is rendered client-side
+            if not any([title, lead_agency, location, description]):
+                logger.debug(f"No project fields in HTML for {project_url}")
+                return None
             
             # Extract dates
-            date_posted = self._extract_date(soup, "Date Posted")
-            comment_deadline = self._extract_date(soup, "Comment Deadline")
+            date_posted = self._extract_date(tree, "Date Posted")
+            comment_deadline = self._extract_date(tree, "Comment Deadline")
             
             # Extract document URLs
-            document_urls = self._extract_document_urls(soup)
+            document_urls = self._extract_document_urls(tree)
             
             # Create project object
             project = CEQAProject(
                 title=title or "Unknown Project",
                 lead_agency=lead_agency or "",
-                city=city,
-                county=county,
+                city="",
+                county="",
                 address=location or "",
                 project_description=description or "",
                 project_type=project_type or "",
@@ -265,9 +666,8 @@ class CEQAScraper:
                 document_urls=document_urls
             )
             
-            # Classify as warehouse and get geocoding
-            self._classify_warehouse(project)
-            self._geocode_project(project)
+            # Resolve city/county and classify (geocoding is queued by the caller)
+            self._finalize(project)
             
             return project
             
@@ -275,27 +675,13 @@ class CEQAScraper:
             logger.error(f"Error scraping project {project_url}: {e}")
             return None
 
-    def _extract_field(self, soup, field_name: str, tag: str = None) -> Optional[str]:
-        """Extract a field value from the soup"""
+    def _extract_field(self, tree, field_name: str) -> Optional[str]:
+        """Extract a field value from the parsed page"""
         try:
-            # Try multiple selector strategies
-            selectors = [
-                f"*:contains('{field_name}') + *",
-                f"*:contains('{field_name}')",
-                f"dt:contains('{field_name}') + dd",
-                f"label:contains('{field_name}') + *"
-            ]
-            
-            for selector in selectors:
-                elements = soup.select(selector)
-                if elements:
-                    return elements[0].get_text(strip=True)
-            
-            # Fallback: find by text content
-            for elem in soup.find_all(text=re.compile(field_name, re.I)):
-                parent = elem.parent
-                if parent and parent.next_sibling:
-                    return parent.next_sibling.get_text(strip=True)
+            elements = (self.field_xpath(tree, name=field_name)
+                        or self.field_fallback_xpath(tree, name=field_name))
+            if elements:
+                return elements[0].text_content().strip()
             
             return None
             
@@ -303,123 +689,178 @@ class CEQAScraper:
             logger.debug(f"Could not extract field '{field_name}': {e}")
             return None
 
-    def _parse_location(self, location: str) -> Tuple[str, str]:
-        """Parse location string into city and county"""
-        if not location:
-            return "", ""
+    def _finalize(self, project: CEQAProject):
+        """Resolve city/county and warehouse classification in one pass
         
-        # Try to match IE cities and counties
-        location_lower = location.lower()
+        Title, description and address are lowercased together once, with a
+        NUL separator, and scanned once with the tagged automaton. Warehouse
+        keywords only count in the title/description span and city names
+        only in the address span.
+        """
+        lower = f"{project.title} {project.project_description}\0{project.address}".lower()
+        boundary = lower.index('\0')
         
-        # Check counties
-        county = ""
-        if "san bernardino" in location_lower:
-            county = "San Bernardino"
-        elif "riverside" in location_lower:
-            county = "Riverside"
+        # Each keyword counts once however often it appears; first city mentioned wins
+        keyword_hits = set()
+        city_match = None
+        for end, (kind, value) in self.text_automaton.iter(lower):
+            if end < boundary:
+                if kind == 'keyword':
+                    keyword_hits.add(value)
+            elif kind == 'city':
+                city_match = value
+                break
         
-        # Check cities
-        city = ""
-        for county_name, cities in self.ie_cities.items():
-            for city_name in cities:
-                if city_name in location_lower:
-                    city = city_name.title()
-                    if not county:
-                        county = county_name.title()
-                    break
+        hits = sorted(keyword_hits)
+        confidence = sum(self.keyword_weight_list[index] for index in hits)
+        
+        project.warehouse_confidence = min(confidence, 1.0)
+        project.is_warehouse = confidence >= 0.3  # Threshold for classification
+        project.detection_keywords = [self.keyword_list[index] for index in hits]
+        
+        # County named in the location takes precedence over the city's county
+        if lower.find("san bernardino", boundary) != -1:
+            project.county = "San Bernardino"
+        elif lower.find("riverside", boundary) != -1:
+            project.county = "Riverside"
         
-        return city, county
+        if city_match:
+            city_name, county_name = city_match
+            project.city = city_name.title()
+            if not project.county:
+                project.county = county_name.title()
+        
+        if project.is_warehouse:
+            logger.info(f"Classified as warehouse: {project.title} (confidence: {confidence:.2f})")
 
-    def _extract_date(self, soup, field_name: str) -> Optional[datetime]:
+    def _extract_date(self, tree, field_name: str) -> Optional[datetime]:
         """Extract and parse date fields"""
-        date_str = self._extract_field(soup, field_name)
+        date_str = self._extract_field(tree, field_name)
         if not date_str:
             return None
         
-        # Try common date formats
-        date_formats = ["%m/%d/%Y", "%Y-%m-%d", "%B %d, %Y"]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except ValueError:
-                continue
+        # Dispatch on the date's shape instead of trying each strptime format
+        date_str = date_str.strip()
+        try:
+            match = DATE_US_RE.match(date_str)
+            if match:
+                return datetime(int(match[3]), int(match[1]), int(match[2]))
+            
+            match = DATE_ISO_RE.match(date_str)
+            if match:
+                return datetime(int(match[1]), int(match[2]), int(match[3]))
+            
+            match = DATE_LONG_RE.match(date_str)
+            if match and match[1].lower() in MONTH_NUMBERS:
+                return datetime(int(match[3]), MONTH_NUMBERS[match[1].lower()], int(match[2]))
+        except ValueError:
+            pass
         
         logger.debug(f"Could not parse date: {date_str}")
         return None
 
-    def _extract_document_urls(self, soup) -> List[str]:
+    def _extract_document_urls(self, tree) -> List[str]:
         """Extract PDF and document URLs"""
         urls = []
         
         # Look for PDF links
-        pdf_links = soup.find_all('a', href=re.compile(r'\.pdf$', re.I))
-        for link in pdf_links:
-            href = link.get('href')
-            if href:
+        for href in tree.xpath('.//a/@href'):
+            if href.lower().endswith('.pdf'):
                 if href.startswith('http'):
                     urls.append(href)
                 else:
-                    urls.append(f"https://ceqanet.lci.ca.gov{href}")
+                    urls.append(f"{CEQA_BASE_URL}{href}")
         
         return urls
 
-    def _classify_warehouse(self, project: CEQAProject):
-        """Determine if project is warehouse-related and confidence score"""
-        text_to_analyze = f"{project.title} {project.project_description}".lower()
-        
-        confidence = 0.0
-        keywords_found = []
-        
-        # Check high confidence keywords
-        for keyword in self.warehouse_keywords['high_confidence']:
-            if keyword in text_to_analyze:
-                confidence += 0.3
-                keywords_found.append(keyword)
-        
-        # Check medium confidence keywords
-        for keyword in self.warehouse_keywords['medium_confidence']:
-            if keyword in text_to_analyze:
-                confidence += 0.15
-                keywords_found.append(keyword)
+    def _geocode_cache_key(self, project: CEQAProject) -> str:
+        """Build a normalized cache key from the project's address fields"""
+        query = f"{project.address}|{project.city}|{project.county}"
+        return ' '.join(query.lower().split())
+
+    def _get_cached_geocode(self, key: str) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """Look up cached coordinates; misses are only trusted until they expire"""
+        row = self.cache_db.execute(
+            "SELECT latitude, longitude, cached_at FROM geocode_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if not row:
+            return None
         
-        # Check low confidence keywords
-        for keyword in self.warehouse_keywords['low_confidence']:
-            if keyword in text_to_analyze:
-                confidence += 0.05
-                keywords_found.append(keyword)
+        latitude, longitude, cached_at = row
+        if latitude is None and time.time() - cached_at > GEOCODE_MISS_TTL:
+            return None
+        return latitude, longitude
+
+    def _cache_geocode(self, key: str, latitude: Optional[float], longitude: Optional[float]):
+        """Store geocoding result (including misses) in the cache"""
+        self.cache_db.execute(
+            "INSERT OR REPLACE INTO geocode_cache (key, latitude, longitude, cached_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, latitude, longitude, time.time())
+        )
+        self.cache_db.commit()
+
+    async def _geocode_worker(self, session: aiohttp.ClientSession, queue: asyncio.Queue):
+        """Geocode queued projects one at a time until a None sentinel arrives"""
+        while True:
+            project = await queue.get()
+            if project is None:
+                break
+            
+            # One bad project must not stop geocoding for the rest of the job
+            try:
+                await self._geocode_project(session, project)
+            except Exception as e:
+                logger.warning(f"Geocoding error for {project.title}: {e}")
+
+    async def _geocode(self, session: aiohttp.ClientSession, query: str) -> Optional[Tuple[float, float]]:
+        """Look up a query on Nominatim, waiting out the rate limit first"""
+        loop = asyncio.get_running_loop()
+        delay = self._next_geocode_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._next_geocode_at = loop.time() + GEOCODE_INTERVAL
         
-        project.warehouse_confidence = min(confidence, 1.0)
-        project.is_warehouse = confidence >= 0.3  # Threshold for classification
-        project.detection_keywords = keywords_found
+        params = {'q': query, 'format': 'json', 'limit': 1}
+        async with session.get(NOMINATIM_URL, params=params) as response:
+            response.raise_for_status()
+            results = await response.json()
         
-        if project.is_warehouse:
-            logger.info(f"Classified as warehouse: {project.title} (confidence: {confidence:.2f})")
+        if not results:
+            return None
+        return float(results[0]['lat']), float(results[0]['lon'])
 
-    def _geocode_project(self, project: CEQAProject):
+    async def _geocode_project(self, session: aiohttp.ClientSession, project: CEQAProject):
         """Get latitude/longitude for project address"""
         if not project.address:
             return
         
         try:
+            key = self._geocode_cache_key(project)
+            cached = self._get_cached_geocode(key)
+            if cached:
+                project.latitude, project.longitude = cached
+                logger.debug(f"Geocoded (cached): {project.title}")
+                return
+            
             # Try geocoding with full address
-            location = self.geocoder.geocode(f"{project.address}, {project.city}, {project.county} County, CA")
+            coords = await self._geocode(
+                session, f"{project.address}, {project.city}, {project.county} County, CA"
+            )
             
-            if location:
-                project.latitude = location.latitude
-                project.longitude = location.longitude
+            if coords:
+                project.latitude, project.longitude = coords
                 logger.debug(f"Geocoded: {project.title}")
             else:
                 # Fallback: try just city
-                location = self.geocoder.geocode(f"{project.city}, CA")
-                if location:
-                    project.latitude = location.latitude
-                    project.longitude = location.longitude
+                coords = await self._geocode(session, f"{project.city}, CA")
+                if coords:
+                    project.latitude, project.longitude = coords
                     logger.debug(f"Geocoded (city fallback): {project.title}")
             
-            time.sleep(1)  # Rate limiting for geocoding service
+            self._cache_geocode(key, project.latitude, project.longitude)
             
-        except GeocoderTimedOut:
+        except asyncio.TimeoutError:
             logger.warning(f"Geocoding timeout for: {project.title}")
         except Exception as e:
             logger.warning(f"Geocoding error for {project.title}: {e}")
@@ -428,57 +869,62 @@ class CEQAScraper:
         """Save scraped projects to Supabase database"""
         logger.info(f"Saving {len(projects)} projects to database")
         
-        for project in projects:
-            try:
-                # Map CEQA document type to UI status
-                ui_status = self._map_ui_status(project.document_type)
-                
-                # Prepare data for insertion
-                data = {
-                    'title': project.title,
-                    'lead_agency': project.lead_agency,
-                    'city': project.city,
-                    'county': project.county,
-                    'address': project.address,
-                    'latitude': project.latitude,
-                    'longitude': project.longitude,
-                    'project_description': project.project_description,
-                    'project_type': project.project_type,
-                    'document_type': project.document_type,
-                    'ceqa_status': project.ceqa_status,
-                    'ui_status': ui_status,
-                    'date_posted': project.date_posted.isoformat() if project.date_posted else None,
-                    'comment_deadline': project.comment_deadline.isoformat() if project.comment_deadline else None,
-                    'ceqa_url': project.ceqa_url,
-                    'document_urls': project.document_urls,
-                    'is_warehouse': project.is_warehouse,
-                    'warehouse_confidence': project.warehouse_confidence,
-                    'detection_keywords': project.detection_keywords or [],
-                    'scrape_date': datetime.now().date().isoformat()
-                }
-                
-                # Insert or update (upsert on ceqa_url)
-                result = self.supabase.table('warehouse_projects').upsert(
-                    data, 
-                    on_conflict='ceqa_url'
-                ).execute()
-                
-                if project.is_warehouse:
-                    logger.info(f"Saved warehouse project: {project.title}")
-                
-            except Exception as e:
-                logger.error(f"Error saving project {project.title}: {e}")
-
-    def _map_ui_status(self, document_type: str) -> str:
-        """Map CEQA document types to UI-friendly statuses"""
-        mapping = {
-            'NOP': 'Proposal',
-            'IS/MND': 'Under Review',
-            'DEIR': 'Under Review',
-            'NOD': 'Approved',
-            'FEIR': 'Approved'
+        scrape_date = datetime.now().date().isoformat()
+        
+        # Postgres rejects an upsert that touches the same ceqa_url twice
+        rows = list({
+            project.ceqa_url: self._to_row(project, scrape_date) for project in projects
+        }.values())
+        
+        # Insert or update (upsert on ceqa_url) in as few requests as possible
+        saved = 0
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            saved += self._upsert_rows(rows[start:start + UPSERT_BATCH_SIZE])
+        
+        logger.info(f"Saved {saved}/{len(rows)} projects")
+
+    def _upsert_rows(self, rows: List[Dict]) -> int:
+        """Upsert a batch of rows, splitting it on failure to isolate bad rows"""
+        try:
+            self.supabase.table('warehouse_projects').upsert(
+                rows,
+                on_conflict='ceqa_url'
+            ).execute()
+            return len(rows)
+            
+        except Exception as e:
+            if len(rows) == 1:
+                logger.error(f"Error saving project {rows[0]['title']}: {e}")
+                return 0
+            
+            logger.warning(f"Batch upsert of {len(rows)} rows failed, retrying in halves: {e}")
+            middle = len(rows) // 2
+            return self._upsert_rows(rows[:middle]) + self._upsert_rows(rows[middle:])
+
+    def _to_row(self, project: CEQAProject, scrape_date: str) -> Dict:
+        """Convert a project into a warehouse_projects row"""
+        return {
+            'title': project.title,
+            'lead_agency': project.lead_agency,
+            'city': project.city,
+            'county': project.county,
+            'address': project.address,
+            'latitude': project.latitude,
+            'longitude': project.longitude,
+            'project_description': project.project_description,
+            'project_type': project.project_type,
+            'document_type': project.document_type,
+            'ceqa_status': project.ceqa_status,
+            'ui_status': UI_STATUS_MAP.get(project.document_type, 'Proposal'),
+            'date_posted': project.date_posted.isoformat() if project.date_posted else None,
+            'comment_deadline': project.comment_deadline.isoformat() if project.comment_deadline else None,
+            'ceqa_url': project.ceqa_url,
+            'document_urls': project.document_urls,
+            'is_warehouse': project.is_warehouse,
+            'warehouse_confidence': project.warehouse_confidence,
+            'detection_keywords': project.detection_keywords or [],
+            'scrape_date': scrape_date
         }
-        return mapping.get(document_type, 'Proposal')
 
     def run_scraping_job(self, max_projects: int = None):
         """Main scraping workflow"""
@@ -499,16 +945,8 @@ class CEQAScraper:
             if max_projects:
                 project_urls = project_urls[:max_projects]
             
-            # Scrape individual projects
-            projects = []
-            for i, url in enumerate(project_urls, 1):
-                logger.info(f"Scraping project {i}/{len(project_urls)}")
-                project = self.scrape_project_details(url)
-                if project:
-                    projects.append(project)
-                
-                # Rate limiting
-                time.sleep(2)
+            # Scrape and geocode individual projects concurrently
+            projects = asyncio.run(self.scrape_projects(project_urls))
             
             # Filter for warehouse projects
             warehouse_projects = [p for p in projects if p.is_warehouse]